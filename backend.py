@@ -9,6 +9,7 @@ import traceback
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
 import dotenv
+import httpx
 
 # Local imports
 from src.Scraper import Scraper
@@ -38,46 +39,55 @@ async def scrape_and_update(delay: int = 60):
     db = Database("profiles.db")
     await db.create_table() # Create the table if it doesn't exist
 
-    while APP_MODE == AppMode.RUNNING:
-        logging.info("Scraping profiles")
-        try:
-            # Scrape URLs asynchronously
-            urls = await scraper.scrape()
-            logging.info(f"Scraped {len(urls)} URLs")
-            
-            # Fetch existing URLs from the database asynchronously
-            db = Database("profiles.db")
-            existing_urls = await db.fetch_existing_urls()
-            logging.info(f"Found {len(existing_urls)} existing profiles")
-            
-            # Create tasks for new URLs asynchronously
-            tasks = []
-            for url in urls:
-                if url not in existing_urls:
-                    logging.info(f"Creating task for {url}")
-                    task = asyncio.create_task(create_and_save_profile(url))
-                    tasks.append(task)
-                else:
-                    logging.warning(f"Updating profile for {url}")
-                    task = asyncio.create_task(update_profile(url))
-                    tasks.append(task)
-            
-            # Wait for all tasks to finish
-            await asyncio.gather(*tasks)
-            logging.info("Finished scraping profiles")
-            logging.info(f"Waiting {delay} seconds")
-        except Exception as exc:
-            tb = traceback.format_exc()
-            logging.error(f"An error occurred: {exc}\nTraceback: {tb}")
-        # Wait for the specified delay
-        await asyncio.sleep(delay)
-
-async def update_profile(url: str):
+    # Share one pooled client across all profile tasks so sockets are reused
+    limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    async with httpx.AsyncClient(limits=limits) as client:
+        while APP_MODE == AppMode.RUNNING:
+            logging.info("Scraping profiles")
+            try:
+                # Scrape URLs asynchronously
+                urls = await scraper.scrape()
+                logging.info(f"Scraped {len(urls)} URLs")
+
+                # Fetch existing URLs from the database asynchronously
+                db = Database("profiles.db")
+                existing_urls = await db.fetch_existing_urls()
+                logging.info(f"Found {len(existing_urls)} existing profiles")
+
+                # Fetch the stored profiles for the URLs being updated in
+                # one query instead of one SELECT per update task
+                update_urls = [url for url in urls if url in existing_urls]
+                db_profiles = await db.fetch_profiles_bulk(update_urls)
+
+                # Create tasks for new URLs asynchronously
+                tasks = []
+                for url in urls:
+                    if url not in existing_urls:
+                        logging.info(f"Creating task for {url}")
+                        task = asyncio.create_task(create_and_save_profile(url, client))
+                        tasks.append(task)
+                    else:
+                        logging.warning(f"Updating profile for {url}")
+                        task = asyncio.create_task(update_profile(url, client, db_profiles.get(url)))
+                        tasks.append(task)
+
+                # Wait for all tasks to finish
+                await asyncio.gather(*tasks)
+                logging.info("Finished scraping profiles")
+                logging.info(f"Waiting {delay} seconds")
+            except Exception as exc:
+                tb = traceback.format_exc()
+                logging.error(f"An error occurred: {exc}\nTraceback: {tb}")
+            # Wait for the specified delay
+            await asyncio.sleep(delay)
+
+async def update_profile(url: str, client: httpx.AsyncClient = None, db_profile: Profile = None):
     try:
         logging.info(f"Updating profile for {url}")
         # Create a Profile instance asynchronously
-        profile: Profile = await Profile.create(url)
-        db_profile: Profile = await Database().fetch_profile(url)
+        profile: Profile = await Profile.create(url, client)
+        if db_profile is None:
+            db_profile = await Database().fetch_profile(url)
         if len(str(profile)) > len(str(db_profile)):
             # Update the profile in the database asynchronously
             await Database().update_profile(profile)  
@@ -87,11 +97,11 @@ async def update_profile(url: str):
         logging.warning(f"Profile update failed for {url}")
         logging.error(exc)
 
-async def create_and_save_profile(url: str):
+async def create_and_save_profile(url: str, client: httpx.AsyncClient = None):
     try:
         logging.info(f"Creating profile for {url}")
         # Create a Profile instance asynchronously
-        profile: Profile = await Profile.create(url)
+        profile: Profile = await Profile.create(url, client)
         
         # Insert the profile into the database asynchronously
         db = Database()
@@ -135,6 +135,38 @@ class Database:
             cur.execute(query)
             return [row[0] for row in cur.fetchall()]  # Return a list of URLs. row[0] is the URL from cur.fetchall()
     
+    async def fetch_profiles_bulk(self, urls: list[str]) -> dict[str, Profile]:
+        """
+        Asynchronously fetches many profiles in one query, keyed by URL.
+        """
+        loop = asyncio.get_running_loop()  # Get the current event loop. Sometimes the loop is not the same as the class loop
+        return await loop.run_in_executor(None, self._sync_fetch_profiles_bulk, urls)
+
+    def _sync_fetch_profiles_bulk(self, urls: list[str]) -> dict[str, Profile]:
+        """Fetches many profiles with a single SELECT ... WHERE url IN (...) per chunk."""
+        profiles = {}
+        if not urls:
+            return profiles
+        with sqlite3.connect(self.db_name) as conn:
+            cur = conn.cursor()
+            # SQLite caps the number of bound parameters, so chunk the IN list
+            for start in range(0, len(urls), 500):
+                chunk = urls[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                cur.execute(f'SELECT * FROM profiles WHERE url IN ({placeholders})', chunk)
+                for row in cur.fetchall():
+                    profile_data = {
+                        'name': row[0],
+                        'department': row[2],
+                        'contact': row[3],
+                        'location': row[4],
+                        'links': eval(row[5]),
+                        'summary': row[6],
+                        'publications': eval(row[7])
+                    }
+                    profiles[row[1]] = Profile(url=row[1], **profile_data)
+        return profiles
+
     async def fetch_profile(self, url: str) -> Profile:
         """
         Asynchronously fetches a profile from the database.
@@ -1,10 +1,53 @@
+import asyncio
 import logging
 import httpx
-from bs4 import BeautifulSoup
+from async_lru import alru_cache
+from bs4 import BeautifulSoup, SoupStrainer
 
 __all__ = ['Profile']
 
+# Element ids read by __get_main, collected in a single tree walk
+WANTED_IDS = {'bannername', 'titlepart1', 'titlepart2', 'titlepart3',
+              'titlepart4', 'titlepart5', 'ot3', 'ot5', 'ot6'}
+
+# Only these tags are ever read by __get_main - straining the parse to
+# them skips the head, scripts, styles, tables etc. entirely. Matched
+# tags keep their full subtree, so nested selectors still resolve.
+PARSE_TAGS = SoupStrainer(['h1', 'a', 'p', 'div', 'span', 'ul'])
+
+# Shared pooled client used when the caller doesn't pass one, so
+# repeated fetches reuse sockets instead of paying a TLS handshake each
+_shared_client: httpx.AsyncClient = None
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """Returns the module-level pooled client, creating it on first use."""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            transport=httpx.AsyncHTTPTransport(retries=2),
+            timeout=10,
+        )
+    return _shared_client
+
+@alru_cache(maxsize=10_000, ttl=3600)
+async def _create(url: str, client: httpx.AsyncClient = None) -> 'Profile':
+    """Builds a Profile for the URL, cached per URL for an hour.
+
+    Module-level because alru_cache is a descriptor: placed inside the
+    class it would bind and prepend the instance/None to the arguments,
+    breaking every Profile.create call.
+    """
+    profile = Profile(url)
+    await profile.fetch_and_process_profile(client)
+    return profile
+
 class Profile:
+    # Fixed attribute layout - thousands of profiles are held in memory
+    # at once, so skip the per-instance __dict__
+    __slots__ = ('url', '_Profile__data', '_Profile__soup',
+                 '_Profile__text', '_Profile__text_lower')
+
     def __init__(self, url: str, **profile_data) -> None:
         self.url = url  # Profile URL
         self.__data = {
@@ -18,32 +61,47 @@ class Profile:
             'url': url
         } # Profile data
         self.__soup = None  # Will be set asynchronously
+        self.__text = None  # Lazily cached profile text
+        self.__text_lower = None  # Lazily cached lowercased profile text
         if len(profile_data) == 0:
             pass  # The actual scraping will happen asynchronously
         else:
             # Set the profile data if provided in the constructor
             self.set_data(**profile_data)
     
-    async def create(url: str) -> 'Profile':
-        """Asynchronously creates a Profile instance."""
-        profile = Profile(url)  # Create an instance
-        await profile.fetch_and_process_profile()
-        return profile
-    
-    async def fetch_and_process_profile(self):
+    async def create(url: str, client: httpx.AsyncClient = None) -> 'Profile':
+        """Asynchronously creates a Profile instance.
+
+        A shared ``httpx.AsyncClient`` can be passed in so that many
+        profiles reuse the same connection pool. Results are cached per
+        URL for an hour, so repeat scrapes of the same page skip both
+        the download and the parse.
+        """
+        return await _create(url, client)
+
+    async def fetch_and_process_profile(self, client: httpx.AsyncClient = None):
         """Fetches the profile page and processes the profile data."""
-        self.__soup = await self.__get_soup()  # Get the BeautifulSoup object
-        self.__data = await self.__get_main()  # Get the profile data
-    
-    async def __get_soup(self) -> BeautifulSoup:
+        self.__soup = await self.__get_soup(client)  # Get the BeautifulSoup object
+        # Parsing is CPU work - run it in the executor so the event loop
+        # keeps issuing requests while earlier responses are processed
+        loop = asyncio.get_running_loop()
+        self.__data = await loop.run_in_executor(None, self.__get_main)
+        self.__soup = None  # Release the parse tree - it is never read again
+        self.__text = None  # Invalidate the cached text
+        self.__text_lower = None
+
+    async def __get_soup(self, client: httpx.AsyncClient = None) -> BeautifulSoup:
         """
         Asynchronously returns the BeautifulSoup object for the profile URL.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(self.url)
-        return BeautifulSoup(response.text, 'html.parser')
-    
-    async def __get_main(self) -> dict:
+        if client is None:
+            client = _get_shared_client()
+        response = await client.get(self.url)
+        # Parse the raw bytes with lxml so it can detect the encoding itself
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, lambda: BeautifulSoup(response.content, 'lxml', parse_only=PARSE_TAGS))
+
+    def __get_main(self) -> dict:
         soup = self.__soup
         # Set default values
         profile_data = {
@@ -57,9 +115,13 @@ class Profile:
             'url': self.url
         }
 
+        # Collect all wanted ids in a single tree walk instead of one
+        # full-tree soup.find(id=...) scan per id
+        found = {tag.get('id'): tag for tag in soup.find_all(id=WANTED_IDS)}
+
         # Name extraction with redundancy
         try:
-            name_parts = [soup.find(id=part_id).text.strip() for part_id in ['bannername', 'titlepart1', 'titlepart2', 'titlepart3'] if soup.find(id=part_id)]
+            name_parts = [found[part_id].text.strip() for part_id in ['bannername', 'titlepart1', 'titlepart2', 'titlepart3'] if part_id in found]
             profile_data['name'] = ' '.join(name_parts) if name_parts else soup.find('h1').text.strip()
         except Exception as e:
             try:
@@ -69,7 +131,7 @@ class Profile:
 
         # Department extraction with redundancy
         try:
-            department_parts = [soup.find(id=part_id).text.strip() for part_id in ['titlepart4', 'titlepart5'] if soup.find(id=part_id)]
+            department_parts = [found[part_id].text.strip() for part_id in ['titlepart4', 'titlepart5'] if part_id in found]
             profile_data['department'] = ', '.join(department_parts) if department_parts else soup.find(class_='department-info').text.strip()
         except Exception as e:
             logging.error(f"Error extracting department: {e}")
@@ -85,7 +147,7 @@ class Profile:
 
         # Location extraction with redundancy
         try:
-            location_parts = [soup.find(id=loc_id).text.strip() for loc_id in ['ot3', 'ot5', 'ot6'] if soup.find(id=loc_id)]
+            location_parts = [found[loc_id].text.strip() for loc_id in ['ot3', 'ot5', 'ot6'] if loc_id in found]
             profile_data['location'] = ', '.join(location_parts) if location_parts else soup.find(class_='location-info').text.strip()
         except Exception as e:
             logging.error(f"Error extracting location: {e}")
@@ -156,6 +218,23 @@ class Profile:
                 self.__data[key] = value
             else:
                 logging.error(f"Key '{key}' does not exist in profile data")
+        self.__text = None  # Invalidate the cached text
+        self.__text_lower = None
+
+    @property
+    def text_lower(self) -> str:
+        """
+        Returns the lowercased profile text, cached so repeated keyword
+        matching doesn't re-lowercase the same string.
+
+        Returns
+        -------
+        str
+            The profile data as a lowercased string.
+        """
+        if self.__text_lower is None:
+            self.__text_lower = str(self).lower()
+        return self.__text_lower
 
     def to_dict(self) -> dict:
         """
@@ -186,14 +265,18 @@ class Profile:
         str
             The profile data as a string.
         """
-        profile_str: str = f"Name: {self.__data['name']}, "
-        profile_str += f"Department: {self.__data['department']}, "
-        profile_str += f"Contact: {self.__data['contact']}, "
-        profile_str += f"Location: {self.__data['location']}, "
-        profile_str += f"Links: {', '.join(self.__data['links'])}, "
-        profile_str += f"Summary: {self.__data['summary']}, "
-        profile_str += f"Publications: {', '.join(self.__data['publications'])}"
-        return profile_str
+        if self.__text is None:
+            # Compose once and cache - ranking calls str(profile) per query
+            self.__text = (
+                f"Name: {self.__data['name']}, "
+                f"Department: {self.__data['department']}, "
+                f"Contact: {self.__data['contact']}, "
+                f"Location: {self.__data['location']}, "
+                f"Links: {', '.join(self.__data['links'])}, "
+                f"Summary: {self.__data['summary']}, "
+                f"Publications: {', '.join(self.__data['publications'])}"
+            )
+        return self.__text
 
     def __repr__(self) -> str:
         return self.__str__()
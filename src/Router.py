@@ -24,6 +24,21 @@ Router = APIRouter()  # The router for the API. Accessed in backend.py
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+_engine: SearchEngine = None
+
+def _get_engine() -> SearchEngine:
+    """
+    Returns the shared SearchEngine instance, creating it on first use.
+
+    The engine is created lazily inside a request so it binds to the
+    running event loop; sharing it lets the TF-IDF index persist across
+    queries instead of being refit per request.
+    """
+    global _engine
+    if _engine is None:
+        _engine = SearchEngine(db=Database(), open_ai_key=OPENAI_API_KEY)
+    return _engine
+
 
 @Router.post("/profiles/long")  # The endpoint for getting profiles
 async def get_profiles(req: ProfileRequest) -> dict:
@@ -42,9 +57,8 @@ async def get_profiles(req: ProfileRequest) -> dict:
     """
     logging.info("POST /profiles/long")
     try:
-        db = Database()
-        # Create a search engine instance
-        engine = SearchEngine(db=db, open_ai_key=OPENAI_API_KEY)
+        # Use the shared search engine instance
+        engine = _get_engine()
         response = await engine.long_search(req.query, 10)
         # Convert the profiles to dictionaries to become serialized
         profiles = [profile.to_dict() for profile in response]
@@ -71,9 +85,8 @@ async def get_profiles(req: ProfileRequest) -> dict:
     """
     logging.info("POST /profiles/quick")
     try:
-        db = Database()
-        # Create a search engine instance
-        engine = SearchEngine(db=db, open_ai_key=OPENAI_API_KEY)
+        # Use the shared search engine instance
+        engine = _get_engine()
         response = await engine.quick_search(req.query, 30)
         # Convert the profiles to dictionaries to become serialized
         profiles = [profile.to_dict() for profile in response]
@@ -100,9 +113,8 @@ async def get_profiles(req: ProfileRequest) -> dict:
     """
     logging.info("POST /profiles/norm")
     try:
-        db = Database()
-        # Create a search engine instance
-        engine = SearchEngine(db=db, open_ai_key=OPENAI_API_KEY)
+        # Use the shared search engine instance
+        engine = _get_engine()
         response = await engine.search(req.query, 20)
         # Convert the profiles to dictionaries to become serialized
         profiles = [profile.to_dict() for profile in response]
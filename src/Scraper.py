@@ -1,9 +1,12 @@
 import json
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 __all__ = ['Scraper']
 
+# The listing pages are only mined for anchors, so skip everything else
+PARSE_TAGS = SoupStrainer('a')
+
 
 class Scraper:
     def __init__(self) -> None:
@@ -14,13 +17,12 @@ class Scraper:
         except FileNotFoundError:
             self.__urls = []
         
-    async def __get_soup(self, url: str) -> BeautifulSoup:
+    async def __get_soup(self, url: str, client: httpx.AsyncClient) -> BeautifulSoup:
         """
         Returns a BeautifulSoup object from the given URL.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-        return BeautifulSoup(response.text, 'html.parser')
+        response = await client.get(url)
+        return BeautifulSoup(response.content, 'lxml', parse_only=PARSE_TAGS)
     
     def __get_links(self, soup: BeautifulSoup) -> list:
         """
@@ -51,7 +53,7 @@ class Scraper:
             for url in self.__urls:
                 try:
                     # Get the BeautifulSoup object from the URL
-                    soup = await self.__get_soup(url)
+                    soup = await self.__get_soup(url, client)
                     links = self.__get_links(soup)
                     profiles.extend(links)
                 
@@ -0,0 +1,59 @@
+import unittest
+
+import httpx
+
+from src import Profile as profile_module
+from src.Profile import Profile
+
+# Minimal profile page covering the fields __get_main extracts
+PAGE = b"""
+<html><head><title>ignored</title></head><body>
+<span id="bannername">Ada Lovelace</span>
+<span id="titlepart4">Department of Computing</span>
+<a href="mailto:a.lovelace@imperial.ac.uk">email</a>
+<div id="customContent"><p>Works on analytical engines.</p></div>
+</body></html>
+"""
+
+
+def _mock_client() -> httpx.AsyncClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=PAGE)
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestProfileCreate(unittest.IsolatedAsyncioTestCase):
+    """Regression tests for Profile.create - the cached factory must keep
+    accepting both call shapes used by the scrape pipeline."""
+
+    async def test_create_with_client_returns_profile(self):
+        url = 'https://www.imperial.ac.uk/people/a.lovelace'
+        async with _mock_client() as client:
+            profile = await Profile.create(url, client)
+        self.assertIsInstance(profile, Profile)
+        self.assertEqual(profile.get_data('url'), url)
+        self.assertEqual(profile.get_data('name'), 'Ada Lovelace')
+
+    async def test_create_without_client_returns_profile(self):
+        url = 'https://www.imperial.ac.uk/people/c.babbage'
+        # Point the shared fallback client at the mock transport
+        original = profile_module._shared_client
+        profile_module._shared_client = _mock_client()
+        try:
+            profile = await Profile.create(url)
+        finally:
+            await profile_module._shared_client.aclose()
+            profile_module._shared_client = original
+        self.assertIsInstance(profile, Profile)
+        self.assertEqual(profile.get_data('url'), url)
+
+    async def test_create_caches_per_url(self):
+        url = 'https://www.imperial.ac.uk/people/g.hopper'
+        async with _mock_client() as client:
+            first = await Profile.create(url, client)
+            second = await Profile.create(url, client)
+        self.assertIs(first, second)
+
+
+if __name__ == '__main__':
+    unittest.main()